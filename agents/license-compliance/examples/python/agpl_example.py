@@ -18,6 +18,22 @@ import os
 import yaml
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+
+def write_temp_yaml(content) -> str:
+    """Serialize content to YAML and write it to a temporary file in one call."""
+    data = yaml.dump(content, Dumper=YamlDumper, default_flow_style=False, encoding='utf-8')
+    fd, path = tempfile.mkstemp(suffix='.yml')
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return path
+
 
 def create_ansible_inventory(hosts: list) -> str:
     """Create a temporary Ansible inventory file."""
@@ -28,9 +44,7 @@ def create_ansible_inventory(hosts: list) -> str:
     }
     
     # Create temporary inventory file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-        yaml.dump(inventory_content, f, default_flow_style=False)
-        return f.name
+    return write_temp_yaml(inventory_content)
 
 
 def create_ansible_playbook() -> str:
@@ -63,9 +77,7 @@ def create_ansible_playbook() -> str:
     ]
     
     # Create temporary playbook file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-        yaml.dump(playbook_content, f, default_flow_style=False)
-        return f.name
+    return write_temp_yaml(playbook_content)
 
 
 def run_ansible_playbook(inventory_file: str, playbook_file: str, dry_run: bool = True):
@@ -79,19 +91,19 @@ def run_ansible_playbook(inventory_file: str, playbook_file: str, dry_run: bool
     
     try:
         print(f"Executing: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-        
-        print("STDOUT:")
-        print(result.stdout)
+        # Stream output line by line instead of buffering it until the process exits
+        with subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1
+        ) as process:
+            for line in process.stdout:
+                print(line, end='')
+            returncode = process.wait()
         
-        if result.stderr:
-            print("STDERR:")
-            print(result.stderr)
+        if returncode:
+            raise subprocess.CalledProcessError(returncode, cmd)
             
     except subprocess.CalledProcessError as e:
         print(f"Ansible playbook failed with return code {e.returncode}")
-        print(f"STDOUT: {e.stdout}")
-        print(f"STDERR: {e.stderr}")
         raise
     except FileNotFoundError:
         print("Error: ansible-playbook command not found. Please install Ansible.")
@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 # /// script
 # dependencies = [
-#     "pydantic"
+#     "pydantic>=2"
 # ]
 # ///
 
@@ -13,42 +13,66 @@ All dependencies used have MIT or compatible licenses.
 """
 
 import json
-from pydantic import BaseModel, validator
+import re
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError, field_validator
 from typing import Optional, List
 
 
+EMAIL_PATTERN = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+
 class User(BaseModel):
     """User model with validation."""
     id: int
     name: str
     email: str
-    age: Optional[int] = None
+    age: Optional[int] = Field(default=None, ge=0)
     tags: List[str] = []
     
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def email_must_contain_at(cls, v):
-        if '@' not in v:
+        if not EMAIL_PATTERN.fullmatch(v):
             raise ValueError('Invalid email format')
         return v
-    
-    @validator('age')
-    def age_must_be_positive(cls, v):
-        if v is not None and v < 0:
-            raise ValueError('Age must be positive')
-        return v
+
+
+USER_LIST_ADAPTER = TypeAdapter(List[User])
+
+
+def format_error(error: dict) -> str:
+    """Format a pydantic error, prefixed with its field path when it has one."""
+    field_path = '.'.join(str(part) for part in error['loc'][1:])
+    return f"{field_path}: {error['msg']}" if field_path else error['msg']
 
 
 def validate_users(users_data: List[dict]) -> List[User]:
-    """Validate a list of user data."""
-    validated_users = []
+    """Validate a list of user data in a single batch."""
+    errors_by_row = {}
+    
+    try:
+        validated_users = USER_LIST_ADAPTER.validate_python(users_data)
+    except ValidationError as e:
+        input_errors = [error for error in e.errors() if not error['loc']]
+        if input_errors:
+            # The input as a whole is invalid (e.g. not a list), so there are no rows to keep
+            for error in input_errors:
+                print(f"✗ Invalid user data: {format_error(error)}")
+            return []
+        for error in e.errors():
+            errors_by_row.setdefault(error['loc'][0], []).append(error)
+        # Re-validate only the rows that passed so the good ones are still returned
+        validated_users = USER_LIST_ADAPTER.validate_python(
+            [user_data for i, user_data in enumerate(users_data) if i not in errors_by_row]
+        )
     
-    for user_data in users_data:
-        try:
-            user = User(**user_data)
-            validated_users.append(user)
-            print(f"✓ Valid user: {user.name}")
-        except Exception as e:
-            print(f"✗ Invalid user data: {e}")
+    valid_users = iter(validated_users)
+    for i in range(len(users_data)):
+        if i in errors_by_row:
+            details = "; ".join(format_error(error) for error in errors_by_row[i])
+            print(f"✗ Invalid user data: {details}")
+        else:
+            print(f"✓ Valid user: {next(valid_users).name}")
     
     return validated_users
 
@@ -71,7 +95,7 @@ def main():
     
     # Export valid users as JSON
     if valid_users:
-        output = [user.dict() for user in valid_users]
+        output = [user.model_dump() for user in valid_users]
         print("\nValid users JSON:")
         print(json.dumps(output, indent=2))
 